@@ -1,7 +1,9 @@
 """Pytest plugin for testing console scripts."""
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
+import functools
 import io
 import logging
 import os
@@ -12,13 +14,15 @@ import sys
 import traceback
 import warnings
 from pathlib import Path
-from typing import Any, Callable, Iterator, Sequence, Union
-from unittest import mock
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Sequence, Union
 
 import pytest
 
 from . import _version
 
+if TYPE_CHECKING:
+    from types import CodeType
+
 if sys.version_info < (3, 10):
     import importlib_metadata
 else:
@@ -34,6 +38,33 @@ _Command = Union[_StrOrPath, Sequence[_StrOrPath]]
 
 StreamMock = io.StringIO
 
+_ENTRY_POINT_CACHE: dict[str, tuple[importlib_metadata.EntryPoint, ...]] = {}
+"""Memoized `console_scripts` entry point lookups by command name."""
+
+_LOADED_SCRIPT_CACHE: dict[str, Callable[[], int | None]] = {}
+"""Loaded entry point callables by command name."""
+
+_WHICH_CACHE: dict[tuple[str, str], str] = {}
+"""Memoized successful `shutil.which` lookups by (command, PATH)."""
+
+
+def _which_cached(command: str, path: str | None) -> str | None:
+    """Locate `command` like `shutil.which`, caching successful lookups.
+
+    Each `shutil.which` call stats every directory in PATH, which adds up
+    in suites that run scripts many times. Misses are not cached so that
+    scripts appearing mid-session are still found.
+    """
+    if path is None:
+        path = os.environ.get('PATH', os.defpath)
+    key = (command, path)
+    result = _WHICH_CACHE.get(key)
+    if result is None:
+        result = shutil.which(command, path=path)
+        if result is not None:
+            _WHICH_CACHE[key] = result
+    return result
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     group = parser.getgroup('console-scripts')
@@ -75,13 +106,26 @@ def _get_mark_mode(metafunc: pytest.Metafunc) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_script(path: str, mtime: float, size: int) -> CodeType:
+    """Compile a script, reusing the code object for repeated runs.
+
+    The stat fields in the key invalidate the cache entry when the script
+    is modified in place between runs.
+    """
+    with open(path, 'rb') as script:
+        # dont_inherit keeps this module's __future__ imports from
+        # leaking into the compiled script.
+        return compile(script.read(), path, 'exec', flags=0,
+                       dont_inherit=True)
+
+
 def _is_nonexecutable_python_file(command: _StrOrPath) -> bool:
     """Check if `command` is a Python file with no executable mode set."""
     command = Path(command)
-    mode = command.stat().st_mode
-    if mode & os.X_OK:
+    if command.suffix != '.py':
         return False
-    return command.suffix == '.py'
+    return not command.stat().st_mode & os.X_OK
 
 
 def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
@@ -150,12 +194,15 @@ def _handle_command_args(
     """
     if shell:
         if args or not isinstance(command, (str, os.PathLike)):
-            command = subprocess.list2cmdline(
+            # The command is already tokenized: quoting it with
+            # list2cmdline only for shlex.split to undo it again would
+            # be a wasteful (and quoting-sensitive) round trip.
+            return [
                 str(arg)
                 for arg in _handle_command_args(
                     command, *args, shell=False, stacklevel=stacklevel + 1
                 )
-            )
+            ]
         command = shlex.split(str(command), posix=os.name == 'posix')
         args = ()
 
@@ -176,6 +223,36 @@ def _handle_command_args(
     return command
 
 
+@contextlib.contextmanager
+def _patch_attr(obj: Any, name: str, new_value: Any) -> Iterator[None]:
+    """Replace an attribute for the duration of a context.
+
+    A minimal stand-in for `mock.patch` that skips its spec and
+    autospec machinery, which is noticeable overhead on every run.
+    """
+    old_value = getattr(obj, name)
+    setattr(obj, name, new_value)
+    try:
+        yield
+    finally:
+        setattr(obj, name, old_value)
+
+
+def _update_environ(new_environ: dict[str, str]) -> None:
+    """Bring `os.environ` to the given state, touching only changed keys.
+
+    Each change to `os.environ` is mirrored into the C environment with
+    putenv/unsetenv, so a wholesale clear+update costs two syscalls per
+    variable even for the (typical) mostly-unchanged environment.
+    """
+    for key in list(os.environ):
+        if key not in new_environ:
+            del os.environ[key]
+    for key, value in new_environ.items():
+        if os.environ.get(key) != value:
+            os.environ[key] = value
+
+
 @contextlib.contextmanager
 def _patch_environ(new_environ: dict[str, str] | None) -> Iterator[None]:
     """Replace the environment for the duration of a context."""
@@ -183,11 +260,9 @@ def _patch_environ(new_environ: dict[str, str] | None) -> Iterator[None]:
         yield
         return
     old_environ = os.environ.copy()
-    os.environ.clear()
-    os.environ.update(new_environ)
+    _update_environ(new_environ)
     yield
-    os.environ.clear()
-    os.environ.update(old_environ)
+    _update_environ(old_environ)
 
 
 @contextlib.contextmanager
@@ -197,9 +272,11 @@ def _chdir_context(new_dir: _StrOrPath | None) -> Iterator[None]:
         yield
         return
     old_cwd = os.getcwd()
-    os.chdir(new_dir)
+    if os.fspath(new_dir) != old_cwd:
+        os.chdir(new_dir)
     yield
-    os.chdir(old_cwd)
+    if os.getcwd() != old_cwd:
+        os.chdir(old_cwd)
 
 
 @contextlib.contextmanager
@@ -276,6 +353,33 @@ class ScriptRunner:
             **options,
         )
 
+    def run_many(
+        self,
+        commands: Sequence[_Command],
+        *,
+        max_workers: int | None = None,
+        **options: Any,
+    ) -> list[RunResult]:
+        """Run independent commands concurrently, returning results in order.
+
+        Only supported in subprocess launch mode: inprocess runs patch
+        global interpreter state and cannot safely overlap. Keyword
+        options are passed through to `run()` for every command, so
+        this is not suitable for stdin-intensive tests: a shared
+        `stdin` stream would be drained by whichever run happens to
+        read it first.
+        """
+        if self.launch_mode != 'subprocess':
+            raise RuntimeError(
+                'run_many() is only supported in subprocess launch mode'
+            )
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(self.run, command, **options)
+                for command in commands
+            ]
+        return [future.result() for future in futures]
+
     @staticmethod
     def _locate_script(
         command: _StrOrPath,
@@ -284,9 +388,9 @@ class ScriptRunner:
         env: dict[str, str] | None,
     ) -> Path:
         """Locate script in PATH or in current directory."""
-        script_path = shutil.which(
-            command,
-            path=env.get('PATH', None) if env is not None else None,
+        script_path = _which_cached(
+            os.fspath(command),
+            env.get('PATH', None) if env is not None else None,
         )
         if script_path is not None:
             return Path(script_path)
@@ -304,22 +408,34 @@ class ScriptRunner:
     ) -> Callable[[], int | None]:
         """Load target script via entry points or compile/exec."""
         if isinstance(command, str):
-            entry_points = tuple(
-                importlib_metadata.entry_points(
-                    group='console_scripts', name=command
+            try:
+                entry_points = _ENTRY_POINT_CACHE[command]
+            except KeyError:
+                entry_points = tuple(
+                    importlib_metadata.entry_points(
+                        group='console_scripts', name=command
+                    )
                 )
-            )
+                _ENTRY_POINT_CACHE[command] = entry_points
             if entry_points:
                 def console_script() -> int | None:
-                    s: Callable[[], int | None] = entry_points[0].load()
+                    # Loading happens on the first call, not here, so
+                    # that import-time side effects of the target module
+                    # run with the streams and environment patched.
+                    try:
+                        s = _LOADED_SCRIPT_CACHE[command]
+                    except KeyError:
+                        s = _LOADED_SCRIPT_CACHE[command] = \
+                            entry_points[0].load()
                     return s()
                 return console_script
 
-        script_path = cls._locate_script(command, cwd=cwd, env=env)
+        script_path = os.fspath(cls._locate_script(command, cwd=cwd, env=env))
 
         def exec_script() -> int:
-            compiled = compile(
-                script_path.read_bytes(), str(script_path), 'exec', flags=0
+            stat = os.stat(script_path)
+            compiled = _compile_script(
+                script_path, stat.st_mtime, stat.st_size
             )
             exec(compiled, {'__name__': '__main__'})
             return 0
@@ -355,10 +471,10 @@ class ScriptRunner:
         stdout_stream = StreamMock()
         stderr_stream = StreamMock()
         with contextlib.ExitStack() as stack:
-            stack.enter_context(mock.patch('sys.stdin', new=stdin_stream))
-            stack.enter_context(contextlib.redirect_stdout(stdout_stream))
-            stack.enter_context(contextlib.redirect_stderr(stderr_stream))
-            stack.enter_context(mock.patch('sys.argv', new=cmd_args))
+            stack.enter_context(_patch_attr(sys, 'stdin', stdin_stream))
+            stack.enter_context(_patch_attr(sys, 'stdout', stdout_stream))
+            stack.enter_context(_patch_attr(sys, 'stderr', stderr_stream))
+            stack.enter_context(_patch_attr(sys, 'argv', cmd_args))
             stack.enter_context(_push_and_reset_logger())
             stack.enter_context(_patch_environ(env))
             stack.enter_context(_chdir_context(cwd))
@@ -418,30 +534,21 @@ class ScriptRunner:
         if stdin is not None:
             stdin_input = stdin.read()
 
-        script_path = cls._locate_script(
-            _handle_command_args(
-                command, *arguments, shell=shell, stacklevel=_stacklevel + 1
-            )[0],
-            cwd=cwd,
-            env=env,
+        cmd_args = _handle_command_args(
+            command, *arguments, shell=shell, stacklevel=_stacklevel + 1
         )
+        script_path = cls._locate_script(cmd_args[0], cwd=cwd, env=env)
         if arguments:
-            command = _handle_command_args(
-                command, *arguments, shell=shell, stacklevel=_stacklevel + 1
-            )
+            command = cmd_args
 
         if _is_nonexecutable_python_file(script_path):
-            command = _handle_command_args(
-                command, shell=shell, stacklevel=_stacklevel + 1
-            )
-            command = [sys.executable or 'python', *command]
+            command = [sys.executable or 'python', *cmd_args]
 
         try:
             cp = subprocess.run(
                 command,
                 input=stdin_input,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                capture_output=True,
                 shell=shell,
                 cwd=cwd,
                 env=env,
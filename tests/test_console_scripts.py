@@ -44,9 +44,14 @@ class RunTest:
         if launch_mode_conf is not None:
             args.append('--script-launch-mode=' + launch_mode_conf)
         result = self.testdir.runpytest(*args)
-        print('\n'.join(['pytest stdout:'] + result.outlines +
-                        ['pytest stderr:'] + result.errlines))
-        result.assert_outcomes(passed=passed, skipped=skipped, failed=failed)
+        try:
+            result.assert_outcomes(
+                passed=passed, skipped=skipped, failed=failed
+            )
+        except AssertionError:
+            print('\n'.join(['pytest stdout:', *result.outlines,
+                             'pytest stderr:', *result.errlines]))
+            raise
         return result
 
 
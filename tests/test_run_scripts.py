@@ -41,6 +41,19 @@ def test_not_installed(
     assert result.stderr == ''
 
 
+@pytest.mark.script_launch_mode('inprocess')
+def test_rerun_edited_script(
+    console_script: Path, script_runner: ScriptRunner
+) -> None:
+    """Compiled code is reused between runs but in-place edits are seen."""
+    for _ in range(2):
+        result = script_runner.run(str(console_script))
+        assert result.stdout == 'foo\n'
+    console_script.write_text('print("foobar")')
+    result = script_runner.run(str(console_script))
+    assert result.stdout == 'foobar\n'
+
+
 @pytest.mark.xfail(
     sys.platform == "win32",
     reason="Windows does not treat Python scripts as executables."
@@ -50,9 +63,10 @@ def test_elsewhere_in_the_path(
     console_script: Path, script_runner: ScriptRunner
 ) -> None:
     console_script.chmod(0o777)
-    env = os.environ.copy()
-    env["PATH"] = f"{console_script.parent}{os.pathsep}{env['PATH']}"
-    result = script_runner.run(console_script.name, env=env)
+    path = f"{console_script.parent}{os.pathsep}{os.environ['PATH']}"
+    result = script_runner.run(
+        console_script.name, env={**os.environ, 'PATH': path}
+    )
     assert result.success
     assert result.stdout == 'foo\n'
     assert result.stderr == ''
@@ -95,6 +109,7 @@ def test_script(script_runner):
     result = script_runner.run(
         [
             'pytest',
+            '-p', 'no:cacheprovider',
             f'--rootdir={tmp_path}',
             test,
             f'--script-launch-mode={launch_mode}'
@@ -103,6 +118,23 @@ def test_script(script_runner):
     assert result.success
 
 
+@pytest.mark.script_launch_mode('subprocess')
+def test_run_many(console_script: Path, script_runner: ScriptRunner) -> None:
+    """Run several commands concurrently and collect results in order."""
+    results = script_runner.run_many([str(console_script)] * 4)
+    assert all(result.success for result in results)
+    assert [result.stdout for result in results] == ['foo\n'] * 4
+
+
+@pytest.mark.script_launch_mode('inprocess')
+def test_run_many_inprocess(
+    console_script: Path, script_runner: ScriptRunner
+) -> None:
+    """run_many is rejected in inprocess mode, which can't overlap runs."""
+    with pytest.raises(RuntimeError, match='subprocess launch mode'):
+        script_runner.run_many([str(console_script)])
+
+
 @pytest.mark.script_launch_mode('inprocess')
 def test_return_None(
     console_script: Path, script_runner: ScriptRunner
@@ -193,9 +225,9 @@ print(os.environ['FOO'])
 os.environ['FOO'] = 'baz'
         """
     )
-    env = os.environ.copy()
-    env['FOO'] = 'bar'
-    result = script_runner.run(str(console_script), env=env)
+    result = script_runner.run(
+        str(console_script), env={**os.environ, 'FOO': 'bar'}
+    )
     assert result.success
     assert result.stdout == 'bar\n'
     assert 'FOO' not in os.environ
@@ -263,6 +295,7 @@ def test_fail(script_runner):
     result = script_runner.run(
         [
             'pytest',
+            '-p', 'no:cacheprovider',
             f'--rootdir={tmp_path}',
             test,
             f'--script-launch-mode={launch_mode}'
@@ -322,7 +355,10 @@ def test_script(script_runner):
     script_runner.run(R'''{console_script}''', print_result=False)
         """
     )
-    result = script_runner.run(['pytest', '-s', f'--rootdir={tmp_path}', test])
+    result = script_runner.run(
+        ['pytest', '-p', 'no:cacheprovider', '-s',
+         f'--rootdir={tmp_path}', test]
+    )
     assert result.success
     assert 'the answer is 42' not in result.stdout
     assert 'Running console script' not in result.stdout
@@ -344,7 +380,8 @@ def test_script(script_runner):
         """
     )
     result = script_runner.run(
-        ['pytest', '-s', '--hide-run-results', f'--rootdir={tmp_path}', test]
+        ['pytest', '-p', 'no:cacheprovider', '-s', '--hide-run-results',
+         f'--rootdir={tmp_path}', test]
     )
     assert result.success
     assert 'the answer is 42' not in result.stdout